@@ -1,4 +1,4 @@
-from math import erf, exp, log, sqrt
+from math import erf, exp, log, pi, sqrt
 
 
 def _validate_inputs(spot: float, strike: float, volatility: float, maturity: float) -> None:
@@ -63,3 +63,61 @@ def price_digital_call_bs(
     _, d2 = compute_d1_d2(spot, strike, rate, volatility, maturity)
     return payoff * exp(-rate * maturity) * normal_cdf(d2)
 
+
+def implied_volatility_bs(
+    price: float,
+    spot: float,
+    strike: float,
+    rate: float,
+    maturity: float,
+    option_type: str = "call",
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    max_volatility: float = 5.0,
+) -> float:
+    """Volatilite implicite par Newton (vega analytique) protege par bissection.
+
+    La tolerance porte sur la volatilite (pas de Newton ou largeur de l'encadrement),
+    et non sur le prix, pour rester fiable sur les ailes tres peu cheres.
+    Leve ValueError si le prix depasse celui obtenu au plafond `max_volatility`
+    ou si la methode ne converge pas en `max_iter` iterations.
+    """
+    option_type = option_type.lower()
+    if option_type not in ("call", "put"):
+        raise ValueError("Le type d'option doit etre 'call' ou 'put'.")
+    _validate_inputs(spot, strike, 1.0, maturity)
+
+    discount = exp(-rate * maturity)
+    if option_type == "call":
+        lower_bound, upper_bound = max(spot - strike * discount, 0.0), spot
+        pricer = price_call_bs
+    else:
+        lower_bound, upper_bound = max(strike * discount - spot, 0.0), strike * discount
+        pricer = price_put_bs
+    if not lower_bound < price < upper_bound:
+        raise ValueError("Le prix est hors des bornes de non-arbitrage.")
+
+    low, high = 1e-6, max_volatility
+    if pricer(spot, strike, rate, high, maturity) < price:
+        raise ValueError("La volatilite implicite depasse le plafond de recherche.")
+
+    vol = 0.2 if low < 0.2 < high else 0.5 * (low + high)
+    for _ in range(max_iter):
+        diff = pricer(spot, strike, rate, vol, maturity) - price
+        if diff > 0:
+            high = vol
+        else:
+            low = vol
+        d1, _ = compute_d1_d2(spot, strike, rate, vol, maturity)
+        vega = spot * exp(-0.5 * d1 * d1) / sqrt(2.0 * pi) * sqrt(maturity)
+        if vega > 1e-12:
+            step = diff / vega
+            if abs(step) < tol:
+                return vol
+            candidate = vol - step
+        else:
+            candidate = low - 1.0
+        if high - low < tol:
+            return 0.5 * (low + high)
+        vol = candidate if low < candidate < high else 0.5 * (low + high)
+    raise ValueError("La volatilite implicite n'a pas converge.")
@@ -0,0 +1,288 @@
+"""Calibration SVI par maturite a partir de snapshots locaux de chaines d'options.
+
+Format d'un snapshot (JSON, un fichier par sous-jacent, nom libre) :
+
+    {"ticker": "AAPL", "spot": 190.0, "rate": 0.04,
+     "quotes": [{"maturity": 0.25, "strike": 180.0, "option_type": "call", "price": 15.2},
+                {"maturity": 0.25, "strike": 200.0, "implied_volatility": 0.21}]}
+"""
+
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .black_scholes import implied_volatility_bs
+from .vol_surface import SviSlice, VolSurface
+
+MIN_QUOTES_PER_SLICE = 5
+
+
+@dataclass(frozen=True)
+class OptionQuote:
+    maturity: float
+    strike: float
+    option_type: str = "call"
+    price: float | None = None
+    implied_volatility: float | None = None
+
+
+@dataclass(frozen=True)
+class ChainSnapshot:
+    ticker: str
+    spot: float
+    rate: float
+    quotes: tuple[OptionQuote, ...]
+
+
+def load_chain_snapshot(path: str | Path) -> ChainSnapshot:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError(f"Le snapshot {path} doit etre un objet JSON.")
+    ticker = str(payload.get("ticker", "")).strip().upper()
+    if not ticker:
+        raise ValueError(f"Ticker manquant dans {path}.")
+    spot = float(payload["spot"])
+    if spot <= 0:
+        raise ValueError(f"Le spot doit etre strictement positif ({ticker}).")
+
+    raw_quotes = payload.get("quotes", [])
+    if not isinstance(raw_quotes, list):
+        raise ValueError(f"Le champ 'quotes' doit etre une liste ({ticker}).")
+
+    quotes = []
+    for raw in raw_quotes:
+        if not isinstance(raw, dict):
+            raise ValueError(f"Chaque cotation doit etre un objet JSON ({ticker}).")
+        price = raw.get("price")
+        implied_volatility = raw.get("implied_volatility")
+        if price is None and implied_volatility is None:
+            raise ValueError(f"Cotation sans prix ni volatilite implicite ({ticker}).")
+        quotes.append(
+            OptionQuote(
+                maturity=float(raw["maturity"]),
+                strike=float(raw["strike"]),
+                option_type=str(raw.get("option_type", "call")).lower(),
+                price=None if price is None else float(price),
+                implied_volatility=None if implied_volatility is None else float(implied_volatility),
+            )
+        )
+    return ChainSnapshot(ticker=ticker, spot=spot, rate=float(payload.get("rate", 0.0)), quotes=tuple(quotes))
+
+
+def _svi_jacobian_row(k: float, params: tuple[float, float, float, float, float]) -> tuple[float, list[float]]:
+    """Variance totale SVI et gradient analytique par rapport a (a, b, rho, m, sigma)."""
+    a, b, rho, m, sigma = params
+    shifted = k - m
+    root = math.sqrt(shifted * shifted + sigma * sigma)
+    value = a + b * (rho * shifted + root)
+    gradient = [
+        1.0,
+        rho * shifted + root,
+        b * shifted,
+        -b * (rho + shifted / root),
+        b * sigma / root,
+    ]
+    return value, gradient
+
+
+def _solve_linear(matrix: list[list[float]], rhs: list[float]) -> list[float]:
+    """Elimination de Gauss avec pivot partiel (systemes 5x5 de Levenberg-Marquardt)."""
+    n = len(rhs)
+    aug = [row[:] + [rhs[i]] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(aug[r][col]))
+        if abs(aug[pivot][col]) < 1e-300:
+            raise ValueError("Systeme lineaire singulier.")
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        for r in range(col + 1, n):
+            factor = aug[r][col] / aug[col][col]
+            for c in range(col, n + 1):
+                aug[r][c] -= factor * aug[col][c]
+    solution = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        acc = aug[r][n] - sum(aug[r][c] * solution[c] for c in range(r + 1, n))
+        solution[r] = acc / aug[r][r]
+    return solution
+
+
+def _project_svi(params: list[float]) -> tuple[float, float, float, float, float]:
+    a, b, rho, m, sigma = params
+    b, rho, sigma = max(b, 0.0), min(max(rho, -0.999), 0.999), max(sigma, 1e-4)
+    # Variance totale minimale a + b * sigma * sqrt(1 - rho^2) maintenue positive.
+    a = max(a, -b * sigma * math.sqrt(1.0 - rho * rho))
+    return a, b, rho, m, sigma
+
+
+def _default_svi_guess(total_variances: list[float]) -> tuple[float, float, float, float, float]:
+    b, sigma = 0.1, 0.1
+    return min(total_variances) - b * sigma, b, 0.0, 0.0, sigma
+
+
+def fit_svi_slice(
+    maturity: float,
+    log_moneyness: list[float],
+    total_variances: list[float],
+    initial: tuple[float, float, float, float, float] | None = None,
+    max_iter: int = 200,
+    tol: float = 1e-14,
+) -> SviSlice:
+    """Moindres carres Levenberg-Marquardt sur la variance totale, Jacobien analytique."""
+    if maturity <= 0:
+        raise ValueError("La maturite doit etre strictement positive.")
+    if len(log_moneyness) != len(total_variances):
+        raise ValueError("Strikes et variances doivent avoir la meme taille.")
+    if len(total_variances) < MIN_QUOTES_PER_SLICE:
+        raise ValueError(f"Au moins {MIN_QUOTES_PER_SLICE} cotations sont necessaires par maturite.")
+
+    def evaluate(params):
+        residuals, jacobian = [], []
+        for k, target in zip(log_moneyness, total_variances):
+            value, gradient = _svi_jacobian_row(k, params)
+            residuals.append(value - target)
+            jacobian.append(gradient)
+        return residuals, jacobian
+
+    params = _project_svi(list(initial if initial is not None else _default_svi_guess(total_variances)))
+    residuals, jacobian = evaluate(params)
+    cost = sum(r * r for r in residuals)
+    damping = 1e-3
+
+    for _ in range(max_iter):
+        jtj = [[sum(row[i] * row[j] for row in jacobian) for j in range(5)] for i in range(5)]
+        jtr = [sum(row[i] * r for row, r in zip(jacobian, residuals)) for i in range(5)]
+        improved = False
+        while damping < 1e10:
+            system = [
+                [jtj[i][j] + (damping * max(jtj[i][i], 1e-12) if i == j else 0.0) for j in range(5)]
+                for i in range(5)
+            ]
+            try:
+                step = _solve_linear(system, [-g for g in jtr])
+            except ValueError:
+                damping *= 10.0
+                continue
+            candidate = _project_svi([p + s for p, s in zip(params, step)])
+            cand_residuals, cand_jacobian = evaluate(candidate)
+            cand_cost = sum(r * r for r in cand_residuals)
+            if cand_cost < cost:
+                improved = True
+                converged = cost - cand_cost < tol * max(cost, 1e-30) or cand_cost < tol
+                params, residuals, jacobian, cost = candidate, cand_residuals, cand_jacobian, cand_cost
+                damping = max(damping / 3.0, 1e-12)
+                break
+            damping *= 3.0
+        if not improved or converged:
+            break
+
+    return SviSlice(maturity, *params)
+
+
+def _scaled_guess(svi: SviSlice, maturity: float) -> tuple[float, float, float, float, float]:
+    """Point de depart a partir d'une tranche voisine (variance totale ~ proportionnelle a T)."""
+    ratio = maturity / svi.maturity
+    return svi.a * ratio, svi.b * ratio, svi.rho, svi.m, svi.sigma
+
+
+def calibrate_snapshot(snapshot: ChainSnapshot, previous: VolSurface | None = None) -> VolSurface:
+    """Calibre une tranche SVI par maturite.
+
+    Chaque tranche part de la tranche la plus proche de la surface precedente
+    (calibration de la veille) si elle existe, sinon de la tranche deja calibree
+    de maturite inferieure. Les cotations dont la volatilite implicite est
+    introuvable sont ignorees, ainsi que les maturites avec moins de
+    MIN_QUOTES_PER_SLICE cotations exploitables.
+    """
+    by_maturity: dict[float, tuple[list[float], list[float]]] = {}
+    for quote in snapshot.quotes:
+        if quote.maturity <= 0 or quote.strike <= 0:
+            continue
+        volatility = quote.implied_volatility
+        if volatility is None:
+            try:
+                volatility = implied_volatility_bs(
+                    quote.price, snapshot.spot, quote.strike, snapshot.rate, quote.maturity, quote.option_type
+                )
+            except ValueError:
+                continue
+        forward = snapshot.spot * math.exp(snapshot.rate * quote.maturity)
+        ks, ws = by_maturity.setdefault(quote.maturity, ([], []))
+        ks.append(math.log(quote.strike / forward))
+        ws.append(volatility * volatility * quote.maturity)
+
+    slices: list[SviSlice] = []
+    for maturity in sorted(by_maturity):
+        ks, ws = by_maturity[maturity]
+        if len(ks) < MIN_QUOTES_PER_SLICE:
+            continue
+        initial = None
+        if previous is not None and previous.slices:
+            nearest = min(previous.slices, key=lambda s: abs(s.maturity - maturity))
+            initial = _scaled_guess(nearest, maturity)
+        elif slices:
+            initial = _scaled_guess(slices[-1], maturity)
+        slices.append(fit_svi_slice(maturity, ks, ws, initial=initial))
+
+    if not slices:
+        raise ValueError(f"Aucune maturite calibrable pour {snapshot.ticker}.")
+    return VolSurface(ticker=snapshot.ticker, spot=snapshot.spot, rate=snapshot.rate, slices=tuple(slices))
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    surfaces: dict[str, VolSurface]
+    failures: dict[str, str]
+
+
+def calibrate_directory(
+    directory: str | Path,
+    previous: dict[str, VolSurface] | None = None,
+    max_workers: int | None = None,
+    pattern: str = "*.json",
+) -> CalibrationResult:
+    """Calibre tous les snapshots d'un repertoire, un sous-jacent par processus.
+
+    Les snapshots sont lus dans le processus principal : la surface de la veille
+    et le resultat sont indexes par le ticker du snapshot, quel que soit le nom
+    du fichier. Un snapshot illisible, non calibrable ou dont le ticker apparait
+    dans plusieurs fichiers n'interrompt pas les autres : son erreur est
+    reportee dans `failures`, indexee par nom de fichier.
+    """
+    paths = sorted(Path(directory).glob(pattern))
+    if not paths:
+        raise ValueError(f"Aucun snapshot trouve dans {directory}.")
+
+    failures: dict[str, str] = {}
+    files_by_ticker: dict[str, list[str]] = {}
+    snapshots: dict[str, ChainSnapshot] = {}
+    for path in paths:
+        try:
+            snapshot = load_chain_snapshot(path)
+        except Exception as exc:
+            failures[path.name] = str(exc) or type(exc).__name__
+            continue
+        files_by_ticker.setdefault(snapshot.ticker, []).append(path.name)
+        snapshots[path.name] = snapshot
+
+    for ticker, names in files_by_ticker.items():
+        if len(names) > 1:
+            for name in names:
+                del snapshots[name]
+                failures[name] = f"Ticker {ticker} present dans plusieurs snapshots : {', '.join(names)}."
+
+    previous = previous or {}
+    surfaces: dict[str, VolSurface] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            name: executor.submit(calibrate_snapshot, snapshot, previous.get(snapshot.ticker))
+            for name, snapshot in snapshots.items()
+        }
+        for name, future in futures.items():
+            try:
+                surface = future.result()
+            except Exception as exc:
+                failures[name] = str(exc) or type(exc).__name__
+                continue
+            surfaces[surface.ticker] = surface
+    return CalibrationResult(surfaces=surfaces, failures=failures)
@@ -0,0 +1,102 @@
+"""Surfaces de volatilite SVI calibrees : stockage compact et interpolation."""
+
+import json
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class SviSlice:
+    """Tranche SVI brute : w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2))."""
+
+    maturity: float
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+
+    def total_variance(self, log_moneyness: float) -> float:
+        shifted = log_moneyness - self.m
+        root = math.sqrt(shifted * shifted + self.sigma * self.sigma)
+        return self.a + self.b * (self.rho * shifted + root)
+
+    def params(self) -> tuple[float, float, float, float, float]:
+        return self.a, self.b, self.rho, self.m, self.sigma
+
+
+_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class VolSurface:
+    ticker: str
+    spot: float
+    rate: float
+    slices: tuple[SviSlice, ...]
+    _maturities: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _cache: dict[tuple[float, float], float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_maturities", tuple(svi.maturity for svi in self.slices))
+        object.__setattr__(self, "_cache", {})
+
+    def volatility(self, strike: float, maturity: float) -> float:
+        """Volatilite implicite pour (strike, maturite), utilisable par les pricers BS."""
+        key = (strike, maturity)
+        cached = self._cache.get(key)
+        if cached is None:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            cached = self._cache[key] = self._interpolate(strike, maturity)
+        return cached
+
+    def _interpolate(self, strike: float, maturity: float) -> float:
+        if strike <= 0:
+            raise ValueError("Le strike doit etre strictement positif.")
+        if maturity <= 0:
+            raise ValueError("La maturite doit etre strictement positive.")
+        if not self.slices:
+            raise ValueError(f"Aucune tranche calibree pour {self.ticker}.")
+
+        # Toutes les tranches sont evaluees a la meme log-moneyness forward k = ln(K / F(T)).
+        k = math.log(strike / (self.spot * math.exp(self.rate * maturity)))
+        index = bisect_left(self._maturities, maturity)
+        if index == 0 or index == len(self.slices):
+            # Hors de la grille : volatilite implicite constante a log-moneyness fixe.
+            svi = self.slices[0] if index == 0 else self.slices[-1]
+            return math.sqrt(max(svi.total_variance(k), 0.0) / svi.maturity)
+
+        # Interpolation lineaire de la variance totale entre les deux tranches encadrantes.
+        left, right = self.slices[index - 1], self.slices[index]
+        weight = (maturity - left.maturity) / (right.maturity - left.maturity)
+        variance = (1.0 - weight) * left.total_variance(k) + weight * right.total_variance(k)
+        return math.sqrt(max(variance, 0.0) / maturity)
+
+
+def save_surfaces(surfaces: dict[str, VolSurface], path: str | Path) -> None:
+    """Ecrit les surfaces au format JSON compact (une liste de parametres par tranche)."""
+    payload = {
+        ticker: {
+            "spot": surface.spot,
+            "rate": surface.rate,
+            "slices": [[svi.maturity, *svi.params()] for svi in surface.slices],
+        }
+        for ticker, surface in surfaces.items()
+    }
+    Path(path).write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+def load_surfaces(path: str | Path) -> dict[str, VolSurface]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {
+        ticker: VolSurface(
+            ticker=ticker,
+            spot=float(entry["spot"]),
+            rate=float(entry["rate"]),
+            slices=tuple(SviSlice(*(float(v) for v in row)) for row in entry["slices"]),
+        )
+        for ticker, entry in payload.items()
+    }
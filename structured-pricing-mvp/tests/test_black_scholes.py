@@ -0,0 +1,25 @@
+import pytest
+
+from structured_pricing.black_scholes import implied_volatility_bs, price_call_bs, price_put_bs
+
+
+@pytest.mark.parametrize(
+    "strike, maturity, volatility, option_type",
+    [(90.0, 0.7, 0.31, "put"), (100.0, 1.0, 0.2, "call"), (150.0, 2.0, 1.2, "call"), (110.0, 0.1, 0.05, "call")],
+)
+def test_implied_volatility_round_trip(strike, maturity, volatility, option_type):
+    pricer = price_call_bs if option_type == "call" else price_put_bs
+    price = pricer(100.0, strike, 0.0, volatility, maturity)
+    implied = implied_volatility_bs(price, 100.0, strike, 0.0, maturity, option_type)
+    assert implied == pytest.approx(volatility, abs=1e-6)
+
+
+def test_implied_volatility_above_cap_raises():
+    price = price_call_bs(100.0, 100.0, 0.0, 6.0, 1.0)
+    with pytest.raises(ValueError):
+        implied_volatility_bs(price, 100.0, 100.0, 0.0, 1.0)
+
+
+def test_implied_volatility_outside_arbitrage_bounds_raises():
+    with pytest.raises(ValueError):
+        implied_volatility_bs(0.5, 100.0, 50.0, 0.0, 1.0)
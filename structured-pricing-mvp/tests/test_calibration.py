@@ -0,0 +1,125 @@
+import json
+import math
+
+import pytest
+
+from structured_pricing.black_scholes import price_call_bs
+from structured_pricing.calibration import (
+    ChainSnapshot,
+    OptionQuote,
+    calibrate_directory,
+    calibrate_snapshot,
+    fit_svi_slice,
+    load_chain_snapshot,
+)
+from structured_pricing.vol_surface import SviSlice
+
+SPOT = 100.0
+RATE = 0.02
+TRUE_SLICES = {
+    0.25: SviSlice(0.25, 0.008, 0.04, -0.6, 0.02, 0.1),
+    1.0: SviSlice(1.0, 0.03, 0.12, -0.5, 0.05, 0.2),
+}
+
+
+def _synthetic_quotes(maturity: float, svi: SviSlice, n_strikes: int = 21) -> list[OptionQuote]:
+    forward = SPOT * math.exp(RATE * maturity)
+    quotes = []
+    for i in range(n_strikes):
+        strike = SPOT * (0.7 + 0.6 * i / (n_strikes - 1))
+        volatility = math.sqrt(svi.total_variance(math.log(strike / forward)) / maturity)
+        price = price_call_bs(SPOT, strike, RATE, volatility, maturity)
+        quotes.append(OptionQuote(maturity=maturity, strike=strike, option_type="call", price=price))
+    return quotes
+
+
+def _synthetic_snapshot(ticker: str = "ABC", extra: list[OptionQuote] | None = None) -> ChainSnapshot:
+    quotes = [q for maturity, svi in TRUE_SLICES.items() for q in _synthetic_quotes(maturity, svi)]
+    return ChainSnapshot(ticker=ticker, spot=SPOT, rate=RATE, quotes=tuple(quotes + (extra or [])))
+
+
+def _write_snapshot(path, snapshot: ChainSnapshot) -> None:
+    payload = {
+        "ticker": snapshot.ticker,
+        "spot": snapshot.spot,
+        "rate": snapshot.rate,
+        "quotes": [
+            {"maturity": q.maturity, "strike": q.strike, "option_type": q.option_type, "price": q.price}
+            for q in snapshot.quotes
+        ],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_svi_parameters_recovered_from_synthetic_prices():
+    surface = calibrate_snapshot(_synthetic_snapshot())
+    assert [s.maturity for s in surface.slices] == list(TRUE_SLICES)
+    for fitted in surface.slices:
+        expected = TRUE_SLICES[fitted.maturity]
+        assert fitted.params() == pytest.approx(expected.params(), abs=1e-4)
+
+
+def test_fit_keeps_total_variance_non_negative():
+    ks = [-0.4, -0.2, -0.1, 0.0, 0.1, 0.2, 0.4]
+    noisy = [0.0194, 0.0278, 0.0162, 0.0448, 0.0015, 0.0288, 0.0025]
+    svi = fit_svi_slice(0.5, ks, noisy)
+    assert svi.a + svi.b * svi.sigma * math.sqrt(1.0 - svi.rho**2) >= -1e-12
+
+
+def test_thin_expiry_is_skipped():
+    thin = [OptionQuote(maturity=2.0, strike=k, price=price_call_bs(SPOT, k, RATE, 0.25, 2.0)) for k in (90, 100, 110)]
+    surface = calibrate_snapshot(_synthetic_snapshot(extra=thin))
+    assert [s.maturity for s in surface.slices] == [0.25, 1.0]
+
+
+def test_unpriceable_quotes_are_dropped():
+    bad = [OptionQuote(maturity=1.0, strike=100.0, price=250.0)]
+    surface = calibrate_snapshot(_synthetic_snapshot(extra=bad))
+    assert surface.slices[1].params() == pytest.approx(TRUE_SLICES[1.0].params(), abs=1e-4)
+
+
+def test_calibrate_directory_isolates_failures(tmp_path):
+    _write_snapshot(tmp_path / "ABC.json", _synthetic_snapshot("ABC"))
+    _write_snapshot(tmp_path / "XYZ.json", _synthetic_snapshot("XYZ"))
+    (tmp_path / "BAD.json").write_text("{not json", encoding="utf-8")
+
+    first = calibrate_directory(tmp_path, max_workers=2)
+    assert set(first.surfaces) == {"ABC", "XYZ"}
+    assert set(first.failures) == {"BAD.json"}
+
+    warm = calibrate_directory(tmp_path, previous=first.surfaces, max_workers=2)
+    assert set(warm.surfaces) == {"ABC", "XYZ"}
+    for fitted in warm.surfaces["XYZ"].slices:
+        assert fitted.params() == pytest.approx(TRUE_SLICES[fitted.maturity].params(), abs=1e-4)
+
+
+@pytest.mark.parametrize("payload", ["[]", '{"ticker": "ABC", "spot": 100.0, "quotes": [1, 2]}'])
+def test_load_rejects_valid_json_of_wrong_shape(tmp_path, payload):
+    path = tmp_path / "ABC.json"
+    path.write_text(payload, encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_chain_snapshot(path)
+
+
+def test_calibrate_directory_survives_wrong_shape_and_keys_by_ticker(tmp_path):
+    _write_snapshot(tmp_path / "abc_2026-10-19.json", _synthetic_snapshot("ABC"))
+    (tmp_path / "LIST.json").write_text("[]", encoding="utf-8")
+    (tmp_path / "QUOTES.json").write_text('{"ticker": "Q", "spot": 1.0, "quotes": [1, 2]}', encoding="utf-8")
+
+    result = calibrate_directory(tmp_path, max_workers=1)
+    assert set(result.surfaces) == {"ABC"}
+    assert set(result.failures) == {"LIST.json", "QUOTES.json"}
+
+    warm = calibrate_directory(tmp_path, previous=result.surfaces, max_workers=1)
+    for fitted in warm.surfaces["ABC"].slices:
+        assert fitted.params() == pytest.approx(TRUE_SLICES[fitted.maturity].params(), abs=1e-4)
+
+
+def test_calibrate_directory_reports_duplicate_tickers(tmp_path):
+    _write_snapshot(tmp_path / "abc_monday.json", _synthetic_snapshot("ABC"))
+    _write_snapshot(tmp_path / "abc_tuesday.json", _synthetic_snapshot("ABC"))
+    _write_snapshot(tmp_path / "XYZ.json", _synthetic_snapshot("XYZ"))
+
+    result = calibrate_directory(tmp_path, max_workers=1)
+    assert set(result.surfaces) == {"XYZ"}
+    assert set(result.failures) == {"abc_monday.json", "abc_tuesday.json"}
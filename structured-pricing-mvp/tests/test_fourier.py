@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from structured_pricing.black_scholes import price_call_bs, price_put_bs
+from structured_pricing.fourier import (
+    BlackScholesModel,
+    HestonModel,
+    price_call_cos,
+    price_chain_cos,
+    price_put_cos,
+)
+
+
+def test_cos_matches_black_scholes_on_chain():
+    model = BlackScholesModel(0.25)
+    strikes = [50.0 + 2.0 * i for i in range(75)]
+    calls = price_chain_cos(model, 100.0, strikes, 0.03, 0.5, "call")
+    puts = price_chain_cos(model, 100.0, strikes, 0.03, 0.5, "put")
+    for strike, call, put in zip(strikes, calls, puts):
+        assert call == pytest.approx(price_call_bs(100.0, strike, 0.03, 0.25, 0.5), abs=1e-10)
+        assert put == pytest.approx(price_put_bs(100.0, strike, 0.03, 0.25, 0.5), abs=1e-10)
+
+
+def test_cos_heston_fang_oosterlee_reference():
+    model = HestonModel(v0=0.0175, kappa=1.5768, theta=0.0398, vol_of_vol=0.5751, rho=-0.5711)
+    assert price_call_cos(model, 100.0, 100.0, 0.0, 1.0) == pytest.approx(5.785155450, abs=1e-6)
+
+
+def test_cos_heston_heavy_left_tail_converges():
+    # References obtenues par integration de Gil-Pelaez independante de la methode COS.
+    model = HestonModel(v0=0.04, kappa=0.5, theta=0.04, vol_of_vol=1.0, rho=-0.9)
+    atm, otm = price_chain_cos(model, 100.0, [100.0, 140.0], 0.0, 1.0)
+    assert atm == pytest.approx(4.403384204, abs=1e-6)
+    assert otm == pytest.approx(0.002238831, rel=1e-3)
+
+
+@pytest.mark.parametrize("vol_of_vol, maturity", [(1e-3, 1.0), (0.3, 0.01)])
+def test_cos_heston_low_vol_of_vol_and_short_maturity(vol_of_vol, maturity):
+    model = HestonModel(v0=0.04, kappa=2.0, theta=0.04, vol_of_vol=vol_of_vol, rho=-0.5)
+    _, c2, c4 = model.cumulants(0.0, maturity)
+    assert c2 == pytest.approx(0.04 * maturity, rel=0.01)
+    assert 0.0 <= c4 < c2 * c2
+
+    reference = price_call_cos(model, 100.0, 100.0, 0.0, maturity, n_terms=8192, truncation=30.0)
+    assert price_call_cos(model, 100.0, 100.0, 0.0, maturity) == pytest.approx(reference, abs=1e-8)
+    assert reference == pytest.approx(price_call_bs(100.0, 100.0, 0.0, 0.2, maturity), rel=2e-3)
+
+
+def test_cos_put_call_parity_and_truncation_pass_through():
+    model = HestonModel(v0=0.04, kappa=2.0, theta=0.05, vol_of_vol=0.6, rho=-0.7)
+    call = price_call_cos(model, 100.0, 95.0, 0.02, 0.75, truncation=10.0)
+    put = price_put_cos(model, 100.0, 95.0, 0.02, 0.75, truncation=10.0)
+    assert call - put == pytest.approx(100.0 - 95.0 * math.exp(-0.02 * 0.75), abs=1e-8)
+
+
+def test_cos_rejects_invalid_option_type():
+    with pytest.raises(ValueError):
+        price_chain_cos(BlackScholesModel(0.2), 100.0, [100.0], 0.0, 1.0, "digital")
@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from structured_pricing.vol_surface import SviSlice, VolSurface, load_surfaces, save_surfaces
+
+
+def _surface() -> VolSurface:
+    return VolSurface(
+        ticker="ABC",
+        spot=100.0,
+        rate=0.03,
+        slices=(
+            SviSlice(0.5, 0.01, 0.08, -0.5, 0.0, 0.15),
+            SviSlice(1.0, 0.02, 0.10, -0.4, 0.02, 0.2),
+        ),
+    )
+
+
+def test_save_load_round_trip(tmp_path):
+    surfaces = {"ABC": _surface()}
+    path = tmp_path / "surfaces.json"
+    save_surfaces(surfaces, path)
+    loaded = load_surfaces(path)
+    assert loaded == surfaces
+    assert loaded["ABC"].volatility(95.0, 0.75) == surfaces["ABC"].volatility(95.0, 0.75)
+
+
+def test_volatility_on_slice_matches_svi():
+    surface = _surface()
+    svi = surface.slices[1]
+    k = math.log(110.0 / (100.0 * math.exp(0.03 * 1.0)))
+    assert surface.volatility(110.0, 1.0) == pytest.approx(math.sqrt(svi.total_variance(k) / 1.0))
+
+
+def test_interpolation_uses_forward_log_moneyness_of_requested_maturity():
+    surface = _surface()
+    maturity = 0.75
+    k = math.log(105.0 / (100.0 * math.exp(0.03 * maturity)))
+    left, right = surface.slices
+    variance = 0.5 * left.total_variance(k) + 0.5 * right.total_variance(k)
+    assert surface.volatility(105.0, maturity) == pytest.approx(math.sqrt(variance / maturity))
+
+
+def test_extrapolation_keeps_implied_vol_at_fixed_log_moneyness():
+    surface = _surface()
+    last = surface.slices[-1]
+    k = math.log(90.0 / (100.0 * math.exp(0.03 * 3.0)))
+    assert surface.volatility(90.0, 3.0) == pytest.approx(math.sqrt(last.total_variance(k) / last.maturity))